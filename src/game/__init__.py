@@ -4,5 +4,6 @@ Game package - Contains UI, rendering, and game loop logic.
 from .game_renderer import GameRenderer
 from .game_controller import GameController
 from .timer_display import TimerDisplay
+from .phase import Phase
 
-__all__ = ['GameRenderer', 'GameController', 'TimerDisplay']
+__all__ = ['GameRenderer', 'GameController', 'TimerDisplay', 'Phase']
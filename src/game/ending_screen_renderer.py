@@ -11,15 +11,24 @@ class EndingScreenRenderer:
     def __init__(self, window_size):
         self.window_size = window_size
         
+        # Font definitions (created once, pygame must already be initialized)
+        self.font_title = pygame.font.Font(None, 48)
+        self.font_data = pygame.font.Font(None, 32)
+        self.font_header = pygame.font.Font(None, 36)
+        self.font_generation = pygame.font.Font(None, 34)
+        self._text_cache = {}  # Rendered text surfaces keyed by (font, text, color)
+        
+        # Semi-transparent overlay, built once in the display format
+        self._overlay = pygame.Surface(window_size).convert()
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(180)
+        
     def render(self, screen, path_solver, right_hand_solver, timer_display):
         """Render the ending screen with comparison data"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface(self.window_size)
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        
-        # Apply overlay
-        screen.blit(overlay, (0, 0))
+        # Apply the overlay first, then draw the text straight onto the screen so
+        # anti-aliased edges blend with the dimmed maze, not with the overlay.
+        # GameRenderer keeps the finished frame, so this runs once per game.
+        screen.blit(self._overlay, (0, 0))
         
         # Get timing data from timer_display
         generation_time = timer_display.generation_time
@@ -29,22 +38,21 @@ class EndingScreenRenderer:
         dfs_total = generation_time + path_solving_time
         right_hand_total = generation_time + right_hand_time
         
-        # Font definitions
-        font_title = pygame.font.Font(None, 48)
-        font_data = pygame.font.Font(None, 32)
-        font_header = pygame.font.Font(None, 36)
-        font_generation = pygame.font.Font(None, 34)
+        font_title = self.font_title
+        font_data = self.font_data
+        font_header = self.font_header
+        font_generation = self.font_generation
         
         center_x = self.window_size[0] // 2
         
         # Title at top center
-        title = font_title.render("Maze Solving Comparison", True, (255, 255, 255))
+        title = self._render_text(font_title, "Maze Solving Comparison", (255, 255, 255))
         title_rect = title.get_rect(center=(center_x, 80))
         screen.blit(title, title_rect)
         
         # Maze generation time in center (shared by both algorithms)
         generation_text = f"Maze Generation: {generation_time:.2f}s"
-        generation_surface = font_generation.render(generation_text, True, (200, 200, 200))
+        generation_surface = self._render_text(font_generation, generation_text, (200, 200, 200))
         generation_rect = generation_surface.get_rect(center=(center_x, 140))
         screen.blit(generation_surface, generation_rect)
         
@@ -87,7 +95,7 @@ class EndingScreenRenderer:
                                solving_time, total_time):
         """Render a single algorithm column"""
         # Header
-        header = font_header.render(algorithm_name, True, color)
+        header = self._render_text(font_header, algorithm_name, color)
         header_rect = header.get_rect(center=(x_pos, start_y))
         screen.blit(header, header_rect)
         
@@ -110,7 +118,7 @@ class EndingScreenRenderer:
             ]
         
         for i, line in enumerate(data):
-            surface = font_data.render(line, True, (255, 255, 255))
+            surface = self._render_text(font_data, line, (255, 255, 255))
             surface_rect = surface.get_rect(center=(x_pos, start_y + 50 + i * line_height))
             screen.blit(surface, surface_rect)
     
@@ -133,17 +141,26 @@ class EndingScreenRenderer:
             analysis_text = "Perfect tie - remarkable!"
         
         # Main comparison text centered
-        faster_surface = font_title.render(faster_text, True, faster_color)
+        faster_surface = self._render_text(font_title, faster_text, faster_color)
         faster_rect = faster_surface.get_rect(center=(center_x, analysis_y))
         screen.blit(faster_surface, faster_rect)
         
         # Additional analysis centered
-        analysis_surface = font_data.render(analysis_text, True, (200, 200, 200))
+        analysis_surface = self._render_text(font_data, analysis_text, (200, 200, 200))
         analysis_rect = analysis_surface.get_rect(center=(center_x, analysis_y + 40))
         screen.blit(analysis_surface, analysis_rect)
         
         # Exit instruction at bottom center
         exit_text = "Press SPACE to exit"
-        exit_surface = font_data.render(exit_text, True, (200, 200, 200))
+        exit_surface = self._render_text(font_data, exit_text, (200, 200, 200))
         exit_rect = exit_surface.get_rect(center=(center_x, analysis_y + 100))
         screen.blit(exit_surface, exit_rect)
+
+    def _render_text(self, font, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
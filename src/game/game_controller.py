@@ -3,19 +3,34 @@ GameController - Main game loop and event handling.
 Follows Single Responsibility Principle - only handles game loop and input.
 """
 import pygame
-import time
 from maze.maze_generator import MazeGenerator
 from maze.maze_structure import MazeStructure
+from maze.directions import UP, RIGHT, DOWN, LEFT
 from solvers.path_solver import PathSolver
 from solvers.right_hand_solver import RightHandSolver
 from game.game_renderer import GameRenderer
 from game.timer_display import TimerDisplay
 from game.game_state_manager import GameStateManager
+from game.phase import Phase
+
+# Posted by an SDL timer every animation_speed ms to advance the animation
+STEP_EVENT = pygame.USEREVENT + 1
+
+# Most animation steps run in one go when catching up after a stall
+MAX_CATCHUP_STEPS = 32
 
 
 class GameController:
     """Controls the main game loop and handles user input."""
     
+    # Robot direction keyed by (sign(dy), sign(dx)); horizontal movement wins on diagonals.
+    # (0, 0) is absent: no movement keeps the current direction.
+    _DIR_TABLE = {
+        (-1, -1): LEFT, (-1, 0): UP,   (-1, 1): RIGHT,
+        (0, -1): LEFT,                 (0, 1): RIGHT,
+        (1, -1): LEFT,  (1, 0): DOWN,  (1, 1): RIGHT,
+    }
+    
     def __init__(self, rows, cols, window_size=(1600, 900), animation_speed=25, ui_font_size=28, animate=True):
         self.rows = rows
         self.cols = cols
@@ -24,7 +39,10 @@ class GameController:
         self.running = True
         self.paused = False
         self.animation_speed = animation_speed
-        self.last_step_time = 0
+        self._dirty = True  # Whether something changed since the last rendered frame
+        self.last_step_time = 0  # Tick (ms) the most recent animation step was due at
+        self._path_cache_tick = None  # (phase, solver step counts) the cached paths belong to
+        self._path_cache = ([], [])
         
         # Initialize components
         self.maze_structure = MazeStructure(rows, cols)
@@ -42,27 +60,41 @@ class GameController:
             self.right_hand_solver, self.timer_display
         )
         
-        pygame.init()
+        # Only queue the events we react to; mouse motion etc. never reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, STEP_EVENT, pygame.VIDEOEXPOSE])
         
     def _get_direction(self, prev_pos, curr_pos):
         """Determine robot direction based on movement"""
         if prev_pos is None or curr_pos is None:
-            return "down"
+            return DOWN
             
-        dx = curr_pos[1] - prev_pos[1]  # col difference
-        dy = curr_pos[0] - prev_pos[0]  # row difference
+        dy = (curr_pos[0] > prev_pos[0]) - (curr_pos[0] < prev_pos[0])  # row sign
+        dx = (curr_pos[1] > prev_pos[1]) - (curr_pos[1] < prev_pos[1])  # col sign
         
-        if dx > 0: return "right"
-        elif dx < 0: return "left"
-        elif dy > 0: return "down"
-        elif dy < 0: return "up"
-        else: return self.state_manager.current_robot_direction  # no movement
+        return GameController._DIR_TABLE.get((dy, dx), self.state_manager.current_robot_direction)
 
     def _handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
+        """Handle pygame events, sleeping until one arrives"""
+        # Block so the OS can deschedule us between steps; the timeout keeps the
+        # on-screen timer refreshing when animation_speed is longer than 50 ms
+        events = [pygame.event.wait(50)]
+        events.extend(pygame.event.get())
+        
+        for event in events:
+            if event.type == STEP_EVENT:
+                if self._update_animation():
+                    self._dirty = True
+                continue
+            if event.type != pygame.NOEVENT:
+                # Any other handled event (key, expose) can change what's on screen
+                self._dirty = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents were lost: next frame must upload everything
+                self.renderer.request_full_update()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if self.state_manager.show_ending_screen:
@@ -72,58 +104,98 @@ class GameController:
                 elif event.key == pygame.K_RETURN:
                     if not self.state_manager.show_ending_screen:
                         self.paused = not self.paused
-                        # Pause/resume timer as well
+                        # Pause/resume timer and the animation step events as well
                         if self.paused:
                             self.timer_display.pause_timer()
+                            pygame.time.set_timer(STEP_EVENT, 0)
                         else:
                             self.timer_display.resume_timer()
+                            self._start_step_timer()
+
+    def _update_animation(self):
+        """Run every animation step that is due. Returns True if the state changed."""
+        now = pygame.time.get_ticks()
+        steps_due = (now - self.last_step_time) // max(1, self.animation_speed)
+        if steps_due <= 0:
+            return False
+        
+        if steps_due > MAX_CATCHUP_STEPS:
+            # Long stall: don't try to replay all of it, just resync to now
+            steps_due = MAX_CATCHUP_STEPS
+            self.last_step_time = now
+        else:
+            self.last_step_time += steps_due * max(1, self.animation_speed)
+        
+        changed = False
+        while steps_due > 0:
+            # Generation runs all due steps as one fused batch; solvers step one at a time
+            batch = steps_due if self.state_manager.current_phase == Phase.GENERATION else 1
+            if not self._step_once(batch):
+                break
+            changed = True
+            steps_due -= batch
+        return changed
 
-    def _update_animation(self, current_time):
-        """Update animation step"""
-        if (not self.animate or self.paused or self.state_manager.show_ending_screen or 
-            current_time - self.last_step_time < self.animation_speed):
-            return
+    def _step_once(self, steps=1):
+        """Advance the animation by one step (or a batch of generation steps). Returns True if the state changed."""
+        if not self.animate or self.paused or self.state_manager.show_ending_screen:
+            return False
             
-        prev_pos = self.state_manager.update_animation_step()
+        prev_pos = self.state_manager.update_animation_step(steps)
         
         # Update robot direction for generation and path solving
-        if self.state_manager.current_phase in ["generation", "path_solving"]:
+        if self.state_manager.current_phase <= Phase.PATH_SOLVING:
             if self.state_manager.current_robot_pos and prev_pos:
                 new_direction = self._get_direction(prev_pos, self.state_manager.current_robot_pos)
-                if self.state_manager.current_robot_pos == self.maze_structure.get_end():
-                    self.state_manager.current_robot_direction = "right"
+                if self.state_manager.current_robot_pos == self.state_manager.end_pos:
+                    self.state_manager.current_robot_direction = RIGHT
                 else:
                     self.state_manager.current_robot_direction = new_direction
-        
-        self.last_step_time = current_time
+        return True
 
-    def _render_frame(self):
-        """Render one frame of the game"""
-        self.renderer.clear_screen()
-        
+    def _render_frame(self, current_time):
+        """Render one frame of the game at the given tick (ms)"""
+        # No clear needed: draw_maze blits the full-window cached background
         if self.state_manager.show_ending_screen:
             self.renderer.render_ending_screen(
                 self.path_solver, self.right_hand_solver, self.timer_display
             )
         else:
             # Get current paths for rendering
-            path_solver_path, right_hand_path = self.state_manager.get_current_paths()
+            path_solver_path, right_hand_path = self._current_paths()
             
             # Draw maze with paths
             self.renderer.draw_maze(path_solver_path, right_hand_path)
             
             # Draw robot if we have a position and not complete
-            if self.state_manager.current_robot_pos and self.state_manager.current_phase != "complete":
+            if self.state_manager.current_robot_pos and self.state_manager.current_phase != Phase.COMPLETE:
                 self.renderer.draw_robot(self.state_manager.current_robot_pos, self.state_manager.current_robot_direction)
-            elif self.state_manager.current_phase == "complete" and self.state_manager.current_robot_pos == self.maze_structure.get_end():
+            elif self.state_manager.current_phase == Phase.COMPLETE and self.state_manager.current_robot_pos == self.state_manager.end_pos:
                 # Keep robot at exit when complete
-                self.renderer.draw_robot(self.state_manager.current_robot_pos, "right")
+                self.renderer.draw_robot(self.state_manager.current_robot_pos, RIGHT)
             
             # Draw UI elements using the timer display
-            self.renderer.draw_ui_elements(self.timer_display, self.state_manager.current_phase)
+            self.renderer.draw_ui_elements(self.timer_display, self.state_manager.current_phase,
+                                           current_time)
         
         self.renderer.update_display()
 
+    def _current_paths(self):
+        """Get current solver paths for rendering, refetched only after a solver step"""
+        # The returned lists are shared between frames and must be treated as read-only
+        tick = (self.state_manager.current_phase,
+                self.path_solver.step_count, self.right_hand_solver.step_count)
+        if tick != self._path_cache_tick:
+            self._path_cache = self.state_manager.get_current_paths()
+            self._path_cache_tick = tick
+        return self._path_cache
+
+    def _start_step_timer(self):
+        """Start posting STEP_EVENT every animation_speed ms"""
+        # Steps are counted from now, so time spent paused is never caught up
+        self.last_step_time = pygame.time.get_ticks()
+        pygame.time.set_timer(STEP_EVENT, max(1, self.animation_speed))
+
     def run(self):
         """Main game loop"""
         clock = pygame.time.Clock()
@@ -131,18 +203,25 @@ class GameController:
         # Start the first phase
         self.state_manager.start_generation_phase()
         
+        # Timer events wake the loop; each one runs however many fixed-length steps
+        # are due, so steps aren't limited to one per frame
+        self._start_step_timer()
+        
         while self.running:
-            current_time = pygame.time.get_ticks()
-            
-            # Handle events
+            # Handle events (including animation steps)
             self._handle_events()
             
-            # Update animation
-            self._update_animation(current_time)
-            
-            # Render frame
-            self._render_frame()
+            # Render lazily: while paused or on the ending screen nothing changes on
+            # its own, so only redraw when an event marked the frame dirty. Otherwise
+            # the running phase timer needs a fresh frame every iteration.
+            idle = self.paused or self.state_manager.show_ending_screen
+            if self._dirty or not idle:
+                if self.state_manager.show_ending_screen:
+                    pygame.time.set_timer(STEP_EVENT, 0)  # No more animation steps
+                self._render_frame(pygame.time.get_ticks())  # One time reading per frame
+                self._dirty = False
             
-            clock.tick(60)
+            # Nothing animates while idle, so drop to a low idle rate
+            clock.tick(15 if idle else 60)
 
         pygame.quit()
@@ -5,19 +5,35 @@ Follows Single Responsibility Principle - only handles rendering and drawing.
 import pygame
 import os
 from game.ending_screen_renderer import EndingScreenRenderer
+from maze.directions import DOWN, DIRECTION_NAMES
+from game.maze_raster import (
+    BORDER, RIGHT_HAND_TRAIL, PATH_SOLVER_TRAIL, START, END,
+    CELL_COLORS, build_cell_states, build_rgb
+)
+
+GRID_LINE_COLOR = (128, 128, 128)
+
+# Robot images loaded once per process: decoded originals, and scaled copies by cell size
+_robot_originals = None
+_robot_image_cache = {}
 
 
 class GameRenderer:
     """Handles rendering of the maze, robot, and UI elements."""
     
+    __slots__ = (
+        "window_size", "maze_structure", "ui_font_size", "cell_size", "maze_width",
+        "maze_height", "offset_x", "offset_y", "screen", "robot_images",
+        "ending_screen_renderer", "_bg_surface", "_cell_states", "_path_solver_trail",
+        "_right_hand_trail", "_tiles", "_cell_rects", "_grid_overlay", "_dirty_rects",
+        "_overlay_rects", "_prev_overlay_rects", "_full_update", "_ending_frame",
+    )
+    
     def __init__(self, window_size, maze_structure, ui_font_size=28):
         self.window_size = window_size
         self.maze_structure = maze_structure
         self.ui_font_size = ui_font_size
         
-        # Initialize ending screen renderer
-        self.ending_screen_renderer = EndingScreenRenderer(window_size)
-        
         # Apply zero margins for all resolutions to maximize maze size
         ui_margin_top = 0   # No top margin - maze goes to edge
         ui_margin_sides = 0  # No side margins - full width
@@ -37,78 +53,202 @@ class GameRenderer:
         self.offset_x = (window_size[0] - self.maze_width) // 2
         self.offset_y = ((window_size[1] - ui_margin_top) - self.maze_height) // 2 + ui_margin_top
         
-        # Load robot images
-        self.robot_images = self._load_robot_images()
+        # pygame is initialized exactly once, here, by the first component that needs it
+        if not pygame.get_init():
+            pygame.init()
         
-        pygame.init()
+        # A plain window surface (no SCALED): SCALED re-presents the whole texture on
+        # every update, which would defeat the dirty-rect uploads in update_display()
         self.screen = pygame.display.set_mode(window_size)
         pygame.display.set_caption("Maze Generator & Solver - Optimized View")
-        self.font = pygame.font.Font(None, 70)
+        
+        # Load robot images (after set_mode so they can be converted to the display format)
+        self.robot_images = self._load_robot_images()
+        
+        # Initialize ending screen renderer (after pygame.init so it can create its fonts)
+        self.ending_screen_renderer = EndingScreenRenderer(window_size)
+        
+        # Cached background: the maze is painted here once and then only
+        # changed cells are repainted, so a frame costs a single blit
+        self._bg_surface = pygame.Surface(window_size).convert()
+        # Single source of truth for painting: the state code of every cell (row-major)
+        self._cell_states = None
+        # Trail cells currently painted, kept as sets for O(1) membership tests
+        # and updated incrementally as the (append-only) solver paths grow
+        self._path_solver_trail = {"cells": set(), "length": 0}
+        self._right_hand_trail = {"cells": set(), "length": 0}
+        self._tiles = self._build_tiles()  # Pre-built cell tiles indexed by cell state
+        # Screen rect of every cell, computed once instead of per repaint (treat as read-only)
+        self._cell_rects = [
+            [pygame.Rect(col * self.cell_size + self.offset_x, row * self.cell_size + self.offset_y,
+                         self.cell_size, self.cell_size)
+             for col in range(maze_structure.cols)]
+            for row in range(maze_structure.rows)
+        ]
+        self._grid_overlay = self._build_grid_overlay()
+        
+        # Dirty-rect tracking so a frame only uploads the screen areas that changed
+        self._dirty_rects = []
+        self._overlay_rects = []       # Robot/UI areas drawn this frame
+        self._prev_overlay_rects = []  # Robot/UI areas drawn last frame (need erasing)
+        self._full_update = True
+        
+        # Composed ending screen (maze + comparison overlay), built on first use
+        self._ending_frame = None
 
     def _load_robot_images(self):
         """Load robot drilling animation images"""
-        images = {}
+        global _robot_originals
+        
+        # Scaled images are shared by every renderer using the same cell size
+        if self.cell_size in _robot_image_cache:
+            return _robot_image_cache[self.cell_size]
+        
         robot_path = "src/images/maze_gen_robot"
         
         try:
-            images["down"] = pygame.image.load(os.path.join(robot_path, "drill_spin_down.gif"))
-            images["left"] = pygame.image.load(os.path.join(robot_path, "drill_spin_left.gif"))
-            images["right"] = pygame.image.load(os.path.join(robot_path, "drill_spin_right.gif"))
-            images["up"] = pygame.image.load(os.path.join(robot_path, "drill_spin_up.gif"))
+            # One image per direction, indexed by the maze.directions constants.
+            # The decoded GIFs are kept so other cell sizes only need a rescale.
+            if _robot_originals is None:
+                _robot_originals = [pygame.image.load(os.path.join(robot_path, f"drill_spin_{name}.gif"))
+                                    for name in DIRECTION_NAMES]
             
-            # Scale images to fit cell size
-            for direction in images:
-                images[direction] = pygame.transform.scale(images[direction], 
-                                                         (self.cell_size, self.cell_size))
+            # Scale images to fit cell size and convert to the display pixel format
+            # so blits don't have to convert pixels every frame
+            images = [pygame.transform.scale(image, (self.cell_size, self.cell_size)).convert_alpha()
+                      for image in _robot_originals]
                 
         except pygame.error:
             # Fallback if images can't be loaded
             images = None
-            
+        
+        _robot_image_cache[self.cell_size] = images
         return images
 
     def draw_maze(self, path_solver_path=None, right_hand_path=None):
         """Draw the complete maze with solution paths"""
+        # Only repaint cells whose maze state or trail membership changed
+        dirty_cells = self.maze_structure.pop_dirty_cells()
+        path_solver_cells = self._sync_trail(self._path_solver_trail, path_solver_path or (), dirty_cells)
+        right_hand_cells = self._sync_trail(self._right_hand_trail, right_hand_path or (), dirty_cells)
+        
+        if self._cell_states is None:
+            # First frame: compose every cell's state and paint the whole maze in bulk
+            self._cell_states = build_cell_states(self.maze_structure.grid,
+                                                  self.maze_structure.get_start(),
+                                                  self.maze_structure.get_end(),
+                                                  path_solver_cells, right_hand_cells)
+            self._paint_full_maze()
+            self.screen.blit(self._bg_surface, (0, 0))
+            return
+        
+        # Loop invariants hoisted out of the per-cell work
         start_pos = self.maze_structure.get_start()
         end_pos = self.maze_structure.get_end()
+        last_row = self.maze_structure.rows - 1
+        cols = self.maze_structure.cols
+        last_col = cols - 1
+        grid = self.maze_structure.grid
+        states = self._cell_states
+        tiles = self._tiles
+        cell_rects = self._cell_rects
+        
+        blit_list = []
+        for cell in dirty_cells:
+            row, col = cell
+            # Special colors for start and end (always visible, highest priority)
+            if cell == start_pos:
+                state = START
+            elif cell == end_pos:
+                state = END
+            # Border override: always dark black
+            elif row == 0 or col == 0 or row == last_row or col == last_col:
+                state = BORDER
+            # Yellow trail for path solver (higher priority than blue)
+            elif cell in path_solver_cells:
+                state = PATH_SOLVER_TRAIL
+            # Blue trail for right-hand solver path
+            elif cell in right_hand_cells:
+                state = RIGHT_HAND_TRAIL
+            else:
+                # Default: grid value is WALL (0) or PATH (1)
+                state = grid[row][col]
+            
+            # Keep the state image current; only cells whose state changed need paint
+            index = row * cols + col
+            if states[index] != state:
+                states[index] = state
+                blit_list.append((tiles[state], cell_rects[row][col]))
+        
+        if len(blit_list) * 4 > len(states):
+            # Large change (e.g. a trail cleared): repaint the whole maze in bulk
+            self._paint_full_maze()
+        else:
+            # Batch all repainted cells into a single blits() call of pre-built tiles
+            self._bg_surface.blits(blit_list, doreturn=0)
+            self._dirty_rects.extend(rect for _, rect in blit_list)
+        self.screen.blit(self._bg_surface, (0, 0))
+
+    def _sync_trail(self, trail, path, dirty_cells):
+        """Bring a painted trail up to date with a solver path, marking changed cells dirty"""
+        cells = trail["cells"]
+        length = trail["length"]
+        
+        if length <= len(path) and (length == 0 or path[length - 1] in cells):
+            # Path only grew since the last frame: just add the new tail
+            new_cells = path[length:]
+            cells.update(new_cells)
+            dirty_cells.update(new_cells)
+        else:
+            # Path was cleared or replaced: repaint both the old and new trail
+            dirty_cells |= cells
+            cells = set(path)
+            dirty_cells |= cells
+            trail["cells"] = cells
+        
+        trail["length"] = len(path)
+        return cells
+
+    def _paint_full_maze(self):
+        """Repaint the whole background from the one-byte-per-cell state image"""
         rows = self.maze_structure.rows
         cols = self.maze_structure.cols
+        pixels = build_rgb(self._cell_states)
         
-        for row in range(rows):
-            for col in range(cols):
-                x = col * self.cell_size + self.offset_x
-                y = row * self.cell_size + self.offset_y
-                
-                # Border override: always dark black unless it's start/end
-                is_border = (row == 0 or row == rows - 1 or col == 0 or col == cols - 1)
-                if is_border and (row, col) not in (start_pos, end_pos):
-                    color = (0, 0, 0)  # dark black border
-                else:
-                    # Default colors: dark gray for walls (0), white for paths (1)
-                    if self.maze_structure.is_wall(row, col):
-                        color = (50, 50, 50)
-                    else:
-                        color = (255, 255, 255)
-                    
-                    # Blue trail for right-hand solver path (drawn first, lowest priority)
-                    if right_hand_path and (row, col) in right_hand_path:
-                        color = (0, 100, 255)  # Blue trail
-                    
-                    # Yellow trail for path solver (higher priority than blue)
-                    if path_solver_path and (row, col) in path_solver_path:
-                        color = (255, 255, 0)  # Yellow trail
-                    
-                    # Special colors for start and end (always visible, highest priority)
-                    if (row, col) == start_pos:
-                        color = (0, 255, 0)  # Green for start
-                    elif (row, col) == end_pos:
-                        color = (255, 0, 0)  # Red for end
-                
-                pygame.draw.rect(self.screen, color, (x, y, self.cell_size, self.cell_size))
-                # Draw grid lines for better visibility
-                pygame.draw.rect(self.screen, (128, 128, 128), (x, y, self.cell_size, self.cell_size), 1)
+        # One pixel per cell, scaled up to cell size (nearest neighbour keeps cells crisp)
+        small = pygame.image.frombuffer(pixels, (cols, rows), "RGB")
+        self._bg_surface.fill((30, 30, 30))
+        self._bg_surface.blit(pygame.transform.scale(small, (self.maze_width, self.maze_height)),
+                              (self.offset_x, self.offset_y))
+        self._bg_surface.blit(self._grid_overlay, (self.offset_x, self.offset_y))
+        self._full_update = True
+
+    def _build_grid_overlay(self):
+        """Pre-render the cell outlines of the whole maze onto a transparent surface"""
+        overlay = pygame.Surface((self.maze_width, self.maze_height), pygame.SRCALPHA)
+        last = self.cell_size - 1
+        for col in range(self.maze_structure.cols):
+            x = col * self.cell_size
+            pygame.draw.line(overlay, GRID_LINE_COLOR, (x, 0), (x, self.maze_height - 1))
+            pygame.draw.line(overlay, GRID_LINE_COLOR, (x + last, 0), (x + last, self.maze_height - 1))
+        for row in range(self.maze_structure.rows):
+            y = row * self.cell_size
+            pygame.draw.line(overlay, GRID_LINE_COLOR, (0, y), (self.maze_width - 1, y))
+            pygame.draw.line(overlay, GRID_LINE_COLOR, (0, y + last), (self.maze_width - 1, y + last))
+        return overlay.convert_alpha()
 
-    def draw_robot(self, position, direction="down"):
+    def _build_tiles(self):
+        """Pre-build one cell-sized tile per cell state, with its grid line"""
+        tiles = []
+        for color in CELL_COLORS:
+            tile = pygame.Surface((self.cell_size, self.cell_size)).convert()
+            tile.fill(color)
+            # Draw grid lines for better visibility
+            pygame.draw.rect(tile, GRID_LINE_COLOR, tile.get_rect(), 1)
+            tiles.append(tile)
+        return tiles
+
+    def draw_robot(self, position, direction=DOWN):
         """Draw the drilling robot at the given position"""
         if not self.robot_images or not position:
             return
@@ -117,32 +257,58 @@ class GameRenderer:
         x = col * self.cell_size + self.offset_x
         y = row * self.cell_size + self.offset_y
         
-        robot_image = self.robot_images.get(direction, self.robot_images["down"])
-        self.screen.blit(robot_image, (x, y))
+        robot_image = self.robot_images[direction]
+        self._overlay_rects.append(self.screen.blit(robot_image, (x, y)))
 
-    def draw_ui_elements(self, timer_display, current_phase):
+    def draw_ui_elements(self, timer_display, current_phase, current_ticks=None):
         """Draw all UI elements using the timer display"""
         # Algorithm info (top left) and timer (top right)
-        timer_display.draw_algorithm_info(self.screen, current_phase)
-        timer_display.draw_current_timer(self.screen)
+        for rect in (timer_display.draw_algorithm_info(self.screen, current_phase),
+                     timer_display.draw_current_timer(self.screen, current_ticks)):
+            if rect:
+                self._overlay_rects.append(rect)
 
     def render_ending_screen(self, path_solver, right_hand_solver, timer_display):
         """Render the ending screen with comparison data"""
-        # Draw blurred background (maze)
-        path_solver_path = path_solver.get_current_path()
-        right_hand_path = right_hand_solver.get_current_path()
-        self.draw_maze(path_solver_path, right_hand_path)
-        
-        # Delegate ending screen rendering to specialized renderer
-        self.ending_screen_renderer.render(self.screen, path_solver, right_hand_solver, timer_display)
+        # Nothing on the ending screen changes, so it is composed once and
+        # every later frame is a single blit of that image
+        if self._ending_frame is None:
+            # Draw blurred background (maze)
+            path_solver_path = path_solver.get_current_path()
+            right_hand_path = right_hand_solver.get_current_path()
+            self.draw_maze(path_solver_path, right_hand_path)
+            
+            # Delegate ending screen rendering to specialized renderer
+            self.ending_screen_renderer.render(self.screen, path_solver, right_hand_solver, timer_display)
+            self._ending_frame = self.screen.copy()
+        else:
+            self.screen.blit(self._ending_frame, (0, 0))
+        self._full_update = True
 
     def clear_screen(self):
         """Clear the screen with dark background"""
         self.screen.fill((30, 30, 30))
 
+    def request_full_update(self):
+        """Make the next update_display() upload the whole screen instead of dirty rects"""
+        self._full_update = True
+
     def update_display(self):
-        """Update the pygame display"""
-        pygame.display.flip()
+        """Update the pygame display, uploading only dirty areas when few changed"""
+        dirty_rects = self._dirty_rects + self._overlay_rects + self._prev_overlay_rects
+        screen_area = self.window_size[0] * self.window_size[1]
+        dirty_area = sum(rect.w * rect.h for rect in dirty_rects)
+        
+        # Many rects or a large dirty area make a full flip cheaper than update()
+        if self._full_update or len(dirty_rects) > 50 or dirty_area > 0.25 * screen_area:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        
+        self._full_update = False
+        self._dirty_rects = []
+        self._prev_overlay_rects = self._overlay_rects
+        self._overlay_rects = []
         
     def get_screen(self):
         """Get the pygame screen surface"""
@@ -2,31 +2,51 @@
 GameStateManager - Handles game phase transitions and coordination.
 Follows Single Responsibility Principle - only handles state management.
 """
-import time
+from maze.directions import DOWN
+from game.phase import Phase
 
 
 class GameStateManager:
     """Manages game phases and coordinates transitions between different simulation stages."""
     
+    __slots__ = (
+        "maze_generator", "path_solver", "right_hand_solver", "timer_display",
+        "_skip_handlers", "_step_handlers", "_ps_clear_path", "_rh_get_direction",
+        "current_phase", "show_ending_screen", "current_robot_pos", "current_robot_direction",
+        "end_pos",
+    )
+    
     def __init__(self, maze_generator, path_solver, right_hand_solver, timer_display):
         self.maze_generator = maze_generator
         self.path_solver = path_solver
         self.right_hand_solver = right_hand_solver
         self.timer_display = timer_display
         
+        # Per-phase handlers, indexed by Phase (nothing to do once complete)
+        self._skip_handlers = (self._skip_generation, self._skip_path_solving,
+                               self._skip_right_hand, None)
+        self._step_handlers = (self._step_generation, self._step_path_solving,
+                               self._step_right_hand, None)
+        
+        # Optional solver capabilities, resolved once instead of hasattr() per step
+        self._ps_clear_path = getattr(path_solver, 'clear_path', None)
+        self._rh_get_direction = getattr(right_hand_solver, 'get_current_direction', None)
+        
         # Game state
-        self.current_phase = "generation"  # "generation", "path_solving", "right_hand", "complete"
+        self.current_phase = Phase.GENERATION
         self.show_ending_screen = False
         
         # Robot state
         self.current_robot_pos = None
-        self.current_robot_direction = "down"
+        self.current_robot_direction = DOWN
+        self.end_pos = None  # Maze exit, fixed once generation has started
     
     def start_generation_phase(self):
         """Start the maze generation phase"""
-        self.current_phase = "generation"
+        self.current_phase = Phase.GENERATION
         self.timer_display.start_generation_timer()
         self.maze_generator.start_generation()
+        self.end_pos = self.maze_generator.maze_structure.get_end()
         self.current_robot_pos = self.maze_generator.get_current_position()
 
     def end_generation_phase(self):
@@ -41,7 +61,7 @@ class GameStateManager:
 
     def start_path_solving_phase(self):
         """Start the path solving phase"""
-        self.current_phase = "path_solving"
+        self.current_phase = Phase.PATH_SOLVING
         self.timer_display.start_path_solving_timer()
         self.path_solver.start_solving()
         self.current_robot_pos = self.path_solver.get_current_position()
@@ -53,12 +73,12 @@ class GameStateManager:
 
     def start_right_hand_phase(self):
         """Start the right-hand solving phase"""
-        self.current_phase = "right_hand"
+        self.current_phase = Phase.RIGHT_HAND
         self.timer_display.start_right_hand_timer()
         
         # Clear the yellow trail before starting right-hand solving
-        if hasattr(self.path_solver, 'clear_path'):
-            self.path_solver.clear_path()
+        if self._ps_clear_path:
+            self._ps_clear_path()
         
         self.right_hand_solver.start_solving()
         self.current_robot_pos = self.right_hand_solver.get_current_position()
@@ -66,65 +86,86 @@ class GameStateManager:
     def end_right_hand_phase(self):
         """End the right-hand solving phase"""
         self.timer_display.end_right_hand_timer()
-        self.current_phase = "complete"
+        self.current_phase = Phase.COMPLETE
         self.show_ending_screen = True
     
     def skip_current_phase(self):
         """Skip the current animation phase"""
-        if self.current_phase == "generation":
-            # Complete maze generation instantly
-            self.maze_generator.create_maze_instantly()
-            self.end_generation_phase()
-        elif self.current_phase == "path_solving":
-            # Complete path solving instantly
-            while not self.path_solver.is_complete():
-                self.path_solver.step_solve()
-            self.end_path_solving_phase()
-        elif self.current_phase == "right_hand":
-            # Complete right-hand solving instantly
-            while not self.right_hand_solver.is_complete():
-                self.right_hand_solver.step_solve()
-            self.end_right_hand_phase()
+        handler = self._skip_handlers[self.current_phase]
+        if handler:
+            handler()
     
-    def update_animation_step(self):
-        """Update one animation step and return whether to continue"""
+    def _skip_generation(self):
+        """Complete maze generation instantly"""
+        self.maze_generator.create_maze_instantly()
+        self.end_generation_phase()
+    
+    def _skip_path_solving(self):
+        """Complete path solving instantly"""
+        self.path_solver.solve_all()
+        self.end_path_solving_phase()
+    
+    def _skip_right_hand(self):
+        """Complete right-hand solving instantly"""
+        self.right_hand_solver.solve_all()
+        self.end_right_hand_phase()
+    
+    def update_animation_step(self, steps=1):
+        """Update up to `steps` animation steps and return the robot position before the last one"""
+        if steps > 1 and self.current_phase == Phase.GENERATION:
+            # All but the last step run as one batch; the last move sets the robot's facing
+            prev_pos = self.current_robot_pos
+            self._step_generation(steps - 1)
+            if self.current_phase != Phase.GENERATION:
+                # The batch finished the maze: leftover steps are dropped, not
+                # carried into path solving
+                return prev_pos
+        
         prev_pos = self.current_robot_pos
         
-        if self.current_phase == "generation":
-            continuing = self.maze_generator.step_generation()
-            self.current_robot_pos = self.maze_generator.get_current_position()
-            
-            if not continuing:
-                self.end_generation_phase()
-                
-        elif self.current_phase == "path_solving":
-            continuing = self.path_solver.step_solve()
-            self.current_robot_pos = self.path_solver.get_current_position()
-            
-            if not continuing:
-                self.end_path_solving_phase()
-                    
-        elif self.current_phase == "right_hand":
-            continuing = self.right_hand_solver.step_solve()
-            self.current_robot_pos = self.right_hand_solver.get_current_position()
-            
-            # Update direction for right-hand solver
-            if hasattr(self.right_hand_solver, 'get_current_direction_name'):
-                self.current_robot_direction = self.right_hand_solver.get_current_direction_name()
-            
-            if not continuing:
-                self.end_right_hand_phase()
+        handler = self._step_handlers[self.current_phase]
+        if handler:
+            handler()
         
         return prev_pos
     
+    def _step_generation(self, steps=1):
+        """Advance maze generation by up to `steps` steps"""
+        continuing = self.maze_generator.step_generation(steps)
+        self.current_robot_pos = self.maze_generator.get_current_position()
+        
+        if not continuing:
+            self.end_generation_phase()
+    
+    def _step_path_solving(self):
+        """Advance path solving by one step"""
+        continuing = self.path_solver.step_solve()
+        self.current_robot_pos = self.path_solver.get_current_position()
+        
+        if not continuing:
+            self.end_path_solving_phase()
+    
+    def _step_right_hand(self):
+        """Advance right-hand solving by one step"""
+        continuing = self.right_hand_solver.step_solve()
+        self.current_robot_pos = self.right_hand_solver.get_current_position()
+        
+        # Update direction for right-hand solver
+        if self._rh_get_direction:
+            self.current_robot_direction = self._rh_get_direction()
+        
+        if not continuing:
+            self.end_right_hand_phase()
+    
     def get_current_paths(self):
         """Get the current solution paths for rendering"""
         # Get current paths for rendering - only yellow path if not in right-hand phase
-        if self.current_phase == "right_hand":
-            path_solver_path = []  # Clear yellow trail during right-hand solving
+        phase = self.current_phase
+        if phase == Phase.PATH_SOLVING or phase == Phase.COMPLETE:
+            path_solver_path = self.path_solver.get_current_path()
         else:
-            path_solver_path = self.path_solver.get_current_path() if self.current_phase != "generation" else []
+            path_solver_path = []  # No yellow trail while generating or during right-hand solving
         
-        right_hand_path = self.right_hand_solver.get_current_path() if self.current_phase == "right_hand" or self.current_phase == "complete" else []
+        right_hand_path = self.right_hand_solver.get_current_path() if phase >= Phase.RIGHT_HAND else []
         
         return path_solver_path, right_hand_path
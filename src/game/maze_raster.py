@@ -0,0 +1,52 @@
+"""
+MazeRaster - Builds a one-pixel-per-cell RGB image of the maze.
+Follows Single Responsibility Principle - only handles cell state to color mapping.
+"""
+
+# Cell state codes; WALL and PATH match the values stored in the maze grid
+WALL, PATH, BORDER, RIGHT_HAND_TRAIL, PATH_SOLVER_TRAIL, START, END = range(7)
+
+# Cell colors, indexed by cell state code
+CELL_COLORS = (
+    (50, 50, 50),     # Dark gray walls
+    (255, 255, 255),  # White paths
+    (0, 0, 0),        # Dark black border
+    (0, 100, 255),    # Blue trail
+    (255, 255, 0),    # Yellow trail
+    (0, 255, 0),      # Green start
+    (255, 0, 0),      # Red end
+)
+
+# Per-channel byte translation tables mapping a state code to its color component
+_CHANNEL_TABLES = [
+    bytes(CELL_COLORS[code][channel] if code < len(CELL_COLORS) else 0 for code in range(256))
+    for channel in range(3)
+]
+
+
+def build_cell_states(grid, start, end, path_solver_cells, right_hand_cells):
+    """Compose a flat row-major bytearray holding the state code of every cell"""
+    rows = len(grid)
+    cols = len(grid[0])
+    
+    # Lowest priority first: grid values, trails, border, then start/end on top
+    states = bytearray().join(grid)
+    for row, col in right_hand_cells:
+        states[row * cols + col] = RIGHT_HAND_TRAIL
+    for row, col in path_solver_cells:
+        states[row * cols + col] = PATH_SOLVER_TRAIL
+    states[:cols] = bytes([BORDER]) * cols
+    states[-cols:] = bytes([BORDER]) * cols
+    states[::cols] = bytes([BORDER]) * rows
+    states[cols - 1::cols] = bytes([BORDER]) * rows
+    states[end[0] * cols + end[1]] = END
+    states[start[0] * cols + start[1]] = START
+    return states
+
+
+def build_rgb(states):
+    """Map cell state codes to packed RGB bytes with one C-level translate() per channel"""
+    pixels = bytearray(len(states) * 3)
+    for channel, table in enumerate(_CHANNEL_TABLES):
+        pixels[channel::3] = states.translate(table)
+    return pixels
@@ -0,0 +1,13 @@
+"""
+Phase - Identifiers for the simulation phases.
+Phases are small ints so per-phase behaviour can be looked up by index.
+"""
+from enum import IntEnum
+
+
+class Phase(IntEnum):
+    """Simulation phases, in the order they run."""
+    GENERATION = 0
+    PATH_SOLVING = 1
+    RIGHT_HAND = 2
+    COMPLETE = 3
@@ -3,18 +3,44 @@ TimerDisplay - Handles timer display for different simulation phases.
 Follows Single Responsibility Principle - only handles timer UI.
 """
 import pygame
-import time
+from game.phase import Phase
+
+# Algorithm label text and color for each Phase
+ALGORITHM_LABELS = (
+    ("Drilling Maze (DFS Algorithm)", (255, 255, 255)),  # White
+    ("Solving with Path Data", (255, 255, 0)),          # Yellow
+    ("Right-Hand Wall Following", (0, 150, 255)),       # Blue
+    ("All Simulations Complete", (0, 255, 0)),          # Green
+)
 
 
 class TimerDisplay:
     """Displays timers for different maze simulation phases."""
     
+    __slots__ = (
+        "window_size", "ui_font_size", "font", "_text_cache", "_background_cache",
+        "_timer_min_width", "_last_timer_key", "_last_timer_surface", "generation_start_time",
+        "generation_time", "generation_paused_time", "path_solving_start_time",
+        "path_solving_time", "path_solving_paused_time", "right_hand_start_time",
+        "right_hand_time", "right_hand_paused_time", "is_paused", "pause_start_time",
+        "current_phase",
+    )
+    
     def __init__(self, window_size, ui_font_size=28):
         self.window_size = window_size
         self.ui_font_size = ui_font_size
         self.font = pygame.font.Font(None, ui_font_size)
-        
-        # Timer states
+        self._text_cache = {}  # Rendered text surfaces keyed by (text, color)
+        self._background_cache = {}  # Semi-transparent label backgrounds keyed by size
+        # The timer background is sized for a wide reading so it keeps one cached
+        # size (and one screen rect) while the digits change
+        self._timer_min_width = self.font.size("Time: 999.9s")[0]
+        # Last rendered timer text, keyed by (tenths of a second, color)
+        self._last_timer_key = None
+        self._last_timer_surface = None
+        
+        # Timer states: start and paused times are integer pygame ticks (ms),
+        # finished phase times are seconds
         self.generation_start_time = None
         self.generation_time = 0
         self.generation_paused_time = 0  # Accumulated paused time
@@ -34,100 +60,104 @@ class TimerDisplay:
         
     def start_generation_timer(self):
         """Start timing the maze generation phase"""
-        self.generation_start_time = time.time()
-        self.current_phase = "generation"
+        self.generation_start_time = pygame.time.get_ticks()
+        self.current_phase = Phase.GENERATION
         
     def end_generation_timer(self):
         """End timing the maze generation phase"""
-        if self.generation_start_time:
-            self.generation_time = time.time() - self.generation_start_time - self.generation_paused_time
+        if self.generation_start_time is not None:
+            self.generation_time = (pygame.time.get_ticks() - self.generation_start_time - self.generation_paused_time) / 1000.0
             self.generation_start_time = None
     
     def start_path_solving_timer(self):
         """Start timing the path solving phase"""
-        self.path_solving_start_time = time.time()
-        self.current_phase = "path_solving"
+        self.path_solving_start_time = pygame.time.get_ticks()
+        self.current_phase = Phase.PATH_SOLVING
         
     def end_path_solving_timer(self):
         """End timing the path solving phase"""
-        if self.path_solving_start_time:
-            self.path_solving_time = time.time() - self.path_solving_start_time - self.path_solving_paused_time
+        if self.path_solving_start_time is not None:
+            self.path_solving_time = (pygame.time.get_ticks() - self.path_solving_start_time - self.path_solving_paused_time) / 1000.0
             self.path_solving_start_time = None
     
     def start_right_hand_timer(self):
         """Start timing the right-hand solving phase"""
-        self.right_hand_start_time = time.time()
-        self.current_phase = "right_hand"
+        self.right_hand_start_time = pygame.time.get_ticks()
+        self.current_phase = Phase.RIGHT_HAND
         
     def end_right_hand_timer(self):
         """End timing the right-hand solving phase"""
-        if self.right_hand_start_time:
-            self.right_hand_time = time.time() - self.right_hand_start_time - self.right_hand_paused_time
+        if self.right_hand_start_time is not None:
+            self.right_hand_time = (pygame.time.get_ticks() - self.right_hand_start_time - self.right_hand_paused_time) / 1000.0
             self.right_hand_start_time = None
     
     def pause_timer(self):
         """Pause the current timer"""
         if not self.is_paused:
             self.is_paused = True
-            self.pause_start_time = time.time()
+            self.pause_start_time = pygame.time.get_ticks()
     
     def resume_timer(self):
         """Resume the current timer"""
-        if self.is_paused and self.pause_start_time:
-            pause_duration = time.time() - self.pause_start_time
+        if self.is_paused and self.pause_start_time is not None:
+            pause_duration = pygame.time.get_ticks() - self.pause_start_time
             
             # Add pause duration to the appropriate phase
-            if self.current_phase == "generation":
+            if self.current_phase == Phase.GENERATION:
                 self.generation_paused_time += pause_duration
-            elif self.current_phase == "path_solving":
+            elif self.current_phase == Phase.PATH_SOLVING:
                 self.path_solving_paused_time += pause_duration
-            elif self.current_phase == "right_hand":
+            elif self.current_phase == Phase.RIGHT_HAND:
                 self.right_hand_paused_time += pause_duration
             
             self.is_paused = False
             self.pause_start_time = None
     
-    def get_current_time(self):
-        """Get the current elapsed time for the active phase"""
-        current_time = time.time()
+    def get_current_time(self, current_ticks=None):
+        """Get the current elapsed time for the active phase, in seconds"""
+        return self._elapsed_ticks(current_ticks) / 1000.0
+    
+    def _elapsed_ticks(self, current_ticks=None):
+        """Get the current elapsed time for the active phase, in integer ticks (ms)"""
+        if current_ticks is None:
+            current_ticks = pygame.time.get_ticks()
         current_pause_time = 0
         
         # If currently paused, calculate current pause duration
-        if self.is_paused and self.pause_start_time:
-            current_pause_time = current_time - self.pause_start_time
+        if self.is_paused and self.pause_start_time is not None:
+            current_pause_time = current_ticks - self.pause_start_time
         
-        if self.current_phase == "generation" and self.generation_start_time:
-            return current_time - self.generation_start_time - self.generation_paused_time - current_pause_time
-        elif self.current_phase == "path_solving" and self.path_solving_start_time:
-            return current_time - self.path_solving_start_time - self.path_solving_paused_time - current_pause_time
-        elif self.current_phase == "right_hand" and self.right_hand_start_time:
-            return current_time - self.right_hand_start_time - self.right_hand_paused_time - current_pause_time
+        if self.current_phase == Phase.GENERATION and self.generation_start_time is not None:
+            return current_ticks - self.generation_start_time - self.generation_paused_time - current_pause_time
+        elif self.current_phase == Phase.PATH_SOLVING and self.path_solving_start_time is not None:
+            return current_ticks - self.path_solving_start_time - self.path_solving_paused_time - current_pause_time
+        elif self.current_phase == Phase.RIGHT_HAND and self.right_hand_start_time is not None:
+            return current_ticks - self.right_hand_start_time - self.right_hand_paused_time - current_pause_time
         
         return 0
     
-    def draw_current_timer(self, screen):
-        """Draw the timer for the current phase in top right corner"""
-        if self.current_phase == "generation" and self.generation_start_time:
-            elapsed = self.get_current_time()  # Use the pause-aware method
-            text = f"Time: {elapsed:.1f}s"
+    def draw_current_timer(self, screen, current_ticks=None):
+        """Draw the timer for the current phase in top right corner, returning the drawn area"""
+        if self.current_phase == Phase.GENERATION and self.generation_start_time is not None:
             color = (255, 255, 255)  # White
-        elif self.current_phase == "path_solving" and self.path_solving_start_time:
-            elapsed = self.get_current_time()  # Use the pause-aware method
-            text = f"Time: {elapsed:.1f}s"
+        elif self.current_phase == Phase.PATH_SOLVING and self.path_solving_start_time is not None:
             color = (255, 255, 0)   # Yellow
-        elif self.current_phase == "right_hand" and self.right_hand_start_time:
-            elapsed = self.get_current_time()  # Use the pause-aware method
-            text = f"Time: {elapsed:.1f}s"
+        elif self.current_phase == Phase.RIGHT_HAND and self.right_hand_start_time is not None:
             color = (0, 150, 255)   # Blue
         else:
-            return  # No timer for complete phase
+            return None  # No timer for complete phase
         
-        surface = self.font.render(text, True, color)
+        # The display only shows tenths, so only re-render when that value changes
+        tenths = (self._elapsed_ticks(current_ticks) + 50) // 100  # Pause-aware, rounded to 0.1s
+        key = (tenths, color)
+        if key != self._last_timer_key:
+            self._last_timer_surface = self.font.render(f"Time: {tenths / 10:.1f}s", True, color).convert_alpha()
+            self._last_timer_key = key
+        surface = self._last_timer_surface
         
         # Create semi-transparent background for text readability
-        bg_surface = pygame.Surface((surface.get_width() + 20, surface.get_height() + 10))
-        bg_surface.fill((0, 0, 0))
-        bg_surface.set_alpha(180)  # Semi-transparent black background
+        bg_surface = self._get_background(max(surface.get_width(), self._timer_min_width) + 20,
+                                          surface.get_height() + 10)
         
         # Position at top right with background
         rect = surface.get_rect()
@@ -137,27 +167,36 @@ class TimerDisplay:
         
         screen.blit(bg_surface, bg_rect)
         screen.blit(surface, rect)
+        return bg_rect
     
     def draw_algorithm_info(self, screen, current_phase):
-        """Draw current algorithm information in top left corner"""
-        if current_phase == "generation":
-            text = "Drilling Maze (DFS Algorithm)"
-            color = (255, 255, 255)  # White
-        elif current_phase == "path_solving":
-            text = "Solving with Path Data"
-            color = (255, 255, 0)   # Yellow
-        elif current_phase == "right_hand":
-            text = "Right-Hand Wall Following"
-            color = (0, 150, 255)   # Blue
-        else:
-            text = "All Simulations Complete"
-            color = (0, 255, 0)     # Green
+        """Draw current algorithm information in top left corner, returning the drawn area"""
+        text, color = ALGORITHM_LABELS[current_phase]
         
         # Create semi-transparent background for text readability
-        surface = self.font.render(text, True, color)
-        bg_surface = pygame.Surface((surface.get_width() + 20, surface.get_height() + 10))
-        bg_surface.fill((0, 0, 0))
-        bg_surface.set_alpha(180)  # Semi-transparent black background
+        surface = self._render_text(text, color)
+        bg_surface = self._get_background(surface.get_width() + 20, surface.get_height() + 10)
         
-        screen.blit(bg_surface, (10, 10))
+        bg_rect = screen.blit(bg_surface, (10, 10))
         screen.blit(surface, (20, 15))  # Text on top of background
+        return bg_rect
+
+    def _render_text(self, text, color):
+        """Render text once and reuse the surface while the string stays the same"""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color).convert_alpha()  # Display format for fast blits
+            self._text_cache[key] = surface
+        return surface
+
+    def _get_background(self, width, height):
+        """Return a cached semi-transparent black background of the given size"""
+        key = (width, height)
+        bg_surface = self._background_cache.get(key)
+        if bg_surface is None:
+            bg_surface = pygame.Surface(key).convert()
+            bg_surface.fill((0, 0, 0))
+            bg_surface.set_alpha(180)  # Semi-transparent black background
+            self._background_cache[key] = bg_surface
+        return bg_surface
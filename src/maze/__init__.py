@@ -3,5 +3,6 @@ Maze package - Contains core maze generation and structure logic.
 """
 from .maze_generator import MazeGenerator
 from .maze_structure import MazeStructure
+from .directions import UP, RIGHT, DOWN, LEFT
 
-__all__ = ['MazeGenerator', 'MazeStructure']
+__all__ = ['MazeGenerator', 'MazeStructure', 'UP', 'RIGHT', 'DOWN', 'LEFT']
@@ -0,0 +1,11 @@
+"""
+Directions - Shared direction constants for moving around the maze grid.
+Directions are small ints so they can index lists instead of dicts.
+"""
+
+# Clockwise order, so turning right is +1 and turning left is -1 (mod 4)
+UP, RIGHT, DOWN, LEFT = range(4)
+
+# (row, col) offset for each direction
+DIRECTION_VECTORS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIRECTION_NAMES = ("up", "right", "down", "left")
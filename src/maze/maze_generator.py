@@ -3,6 +3,14 @@ MazeGenerator - Handles maze generation using DFS algorithm.
 Follows Single Responsibility Principle - only responsible for generating mazes.
 """
 import random
+from itertools import permutations
+
+# DFS moves two cells at a time so a wall cell stays between corridors
+DFS_MOVES = ((0, 2), (2, 0), (0, -2), (-2, 0))
+# Every ordering of DFS_MOVES; picking one at random is a shuffle without the copy
+DFS_MOVE_ORDERS = tuple(permutations(DFS_MOVES))
+DFS_ORDER_COUNT = len(DFS_MOVE_ORDERS)
+DFS_ORDER_BITS = DFS_ORDER_COUNT.bit_length()
 
 
 class MazeGenerator:
@@ -10,13 +18,14 @@ class MazeGenerator:
     
     def __init__(self, maze_structure):
         self.maze_structure = maze_structure
-        self.visited = [[False for _ in range(maze_structure.cols)] 
-                       for _ in range(maze_structure.rows)]
+        # One byte per cell, row-major (index row * cols + col)
+        self.visited = bytearray(maze_structure.rows * maze_structure.cols)
         
         # Animation state
         self.generation_complete = False
         self.current_pos = None
         self.stack = []
+        self.stack_path = []
         self.phase = "dfs"  # "dfs", "solving", "right_hand", "complete"
         
         # Path tracking for solving
@@ -61,96 +70,97 @@ class MazeGenerator:
             sy = 1  # Start DFS from column 1, not column 0
             
         self.maze_structure.carve_path(sx, sy)
-        self.visited[sx][sy] = True
+        self.visited[sx * self.maze_structure.cols + sy] = 1
         self.current_pos = (sx, sy)
         self.stack = [(sx, sy)]
+        # The stack cells with the carved cell between each pair filled in,
+        # kept in step with the stack so the solution path is a plain copy
+        self.stack_path = [(sx, sy)]
         
-    def step_generation(self):
-        """Perform one step of maze generation. Returns True if generation continues, False if complete."""
+    def step_generation(self, steps=1):
+        """Perform up to `steps` steps of maze generation. Returns True if generation continues, False if complete."""
         if self.generation_complete:
             return False
             
-        return self._step_dfs()
+        return self._run_dfs(steps)
     
-    def _step_dfs(self):
-        """One step of depth-first search maze generation"""
-        if not self.stack:
-            # DFS complete
-            self.generation_complete = True
-            return False
-            
-        x, y = self.stack[-1]
+    def _run_dfs(self, max_steps):
+        """Run up to max_steps depth-first search steps in one loop. Returns False once generation is complete."""
+        # Everything the loop touches is bound once, so batching many steps
+        # (e.g. create_maze_instantly) pays no per-step call or lookup overhead
+        stack = self.stack
+        stack_path = self.stack_path
+        maze = self.maze_structure
+        grid = maze.grid
+        mark_dirty = maze.dirty_cells.add
+        end = maze.get_end()
+        visited = self.visited
+        max_row = maze.rows - 1
+        cols = maze.cols
+        max_col = cols - 1
+        getrandbits = random.getrandbits
         
-        # Check if we've reached a cell adjacent to the exit (peek to the right)
-        if not self.found_exit_during_generation:
+        for _ in range(max_steps):
+            if not stack:
+                # DFS complete
+                self.generation_complete = True
+                return False
+                
+            x, y = stack[-1]
+            
+            # Check if we've reached a cell adjacent to the exit (peek to the right)
             # Since exit is always on the right border, only check right neighbor
-            nx, ny = x, y + 1
-            if (nx, ny) == self.maze_structure.get_end():
+            if not self.found_exit_during_generation and (x, y + 1) == end:
                 # Found the exit as right neighbor! Store the path
                 self.found_exit_during_generation = True
-                # Create complete path with intermediate cells filled in, plus the exit
-                complete_path = self._create_complete_path(list(self.stack))
-                complete_path.append(self.maze_structure.get_end())  # Add the exit cell as final destination
-                self.solution_path = complete_path
-        
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        random.shuffle(directions)
-        
-        found_unvisited = False
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 < nx < self.maze_structure.rows - 1 and 0 < ny < self.maze_structure.cols - 1:
-                if not self.visited[nx][ny]:
-                    # Create path to the new cell
-                    self.maze_structure.carve_path(x + dx//2, y + dy//2)
-                    self.maze_structure.carve_path(nx, ny)
-                    self.visited[nx][ny] = True
-                    self.stack.append((nx, ny))
+                # Complete path with intermediate cells filled in, plus the exit
+                self.solution_path = stack_path + [end]
+            
+            # Uniform pick by rejection sampling, as random.choice() does,
+            # without its two Python-level calls per step
+            order = getrandbits(DFS_ORDER_BITS)
+            while order >= DFS_ORDER_COUNT:
+                order = getrandbits(DFS_ORDER_BITS)
+            
+            for dx, dy in DFS_MOVE_ORDERS[order]:
+                nx, ny = x + dx, y + dy
+                if 0 < nx < max_row and 0 < ny < max_col and not visited[nx * cols + ny]:
+                    # Create path to the new cell. Both cells are interior walls
+                    # (the target is unvisited), so they are written directly
+                    # instead of through the bounds-checked carve_path()
+                    between = (x + dx//2, y + dy//2)
+                    grid[between[0]][between[1]] = 1
+                    grid[nx][ny] = 1
+                    mark_dirty(between)
+                    mark_dirty((nx, ny))
+                    visited[nx * cols + ny] = 1
+                    stack.append((nx, ny))
+                    stack_path.append(between)
+                    stack_path.append((nx, ny))
                     # Update robot position to the NEW location immediately
                     self.current_pos = (nx, ny)
-                    found_unvisited = True
                     break
-        
-        if not found_unvisited:
-            self.stack.pop()
-            # Update robot position when backtracking
-            if self.stack:
-                self.current_pos = self.stack[-1]
+            else:
+                # No unvisited neighbour: backtrack
+                stack.pop()
+                del stack_path[-2:]
+                # Update robot position when backtracking
+                if stack:
+                    self.current_pos = stack[-1]
             
         return True
 
-    def _create_complete_path(self, dfs_path):
-        """Fill in the gaps between DFS steps to create a continuous path"""
-        if len(dfs_path) < 2:
-            return dfs_path
-            
-        complete_path = [dfs_path[0]]  # Start with the first cell
-        
-        for i in range(1, len(dfs_path)):
-            prev_cell = dfs_path[i-1]
-            curr_cell = dfs_path[i]
-            
-            # Add intermediate cell between prev and current
-            intermediate_row = (prev_cell[0] + curr_cell[0]) // 2
-            intermediate_col = (prev_cell[1] + curr_cell[1]) // 2
-            
-            # Only add if it's different from previous cell
-            if (intermediate_row, intermediate_col) != prev_cell:
-                complete_path.append((intermediate_row, intermediate_col))
-            
-            complete_path.append(curr_cell)
-        
-        return complete_path
-
     def create_maze_instantly(self):
         """Complete maze generation instantly (for backward compatibility)"""
         # Initialize if not already started
         if not self.current_pos:
             self.start_generation()
         
-        # Complete all steps instantly
-        while not self.generation_complete:
-            self.step_generation()
+        # Complete all steps instantly, in large batches of fused DFS steps
+        if not self.generation_complete:
+            batch = self.maze_structure.rows * self.maze_structure.cols
+            while self._run_dfs(batch):
+                pass
             
     def get_solution_path(self):
         """Return the solution path found during generation"""
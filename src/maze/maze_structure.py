@@ -7,12 +7,16 @@ Follows Single Responsibility Principle - only handles maze data structure.
 class MazeStructure:
     """Handles the maze grid structure and basic queries."""
     
+    __slots__ = ("rows", "cols", "grid", "start", "end", "dirty_cells")
+    
     def __init__(self, rows, cols):
         self.rows = rows
         self.cols = cols
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        # Each row is a compact bytearray of 0 (wall) / 1 (path) values
+        self.grid = [bytearray(cols) for _ in range(rows)]
         self.start = (0, 0)
         self.end = (0, 0)
+        self.dirty_cells = set()  # Cells changed since the renderer last looked
     
     def get_grid(self):
         """Return the current maze grid"""
@@ -28,11 +32,15 @@ class MazeStructure:
     
     def set_start(self, position):
         """Set the start position"""
+        self.dirty_cells.add(self.start)
         self.start = position
+        self.dirty_cells.add(position)
     
     def set_end(self, position):
         """Set the end position"""
+        self.dirty_cells.add(self.end)
         self.end = position
+        self.dirty_cells.add(position)
     
     def is_valid_position(self, row, col):
         """Check if position is within maze bounds"""
@@ -40,25 +48,32 @@ class MazeStructure:
     
     def is_wall(self, row, col):
         """Check if position is a wall (0)"""
-        if not self.is_valid_position(row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
             return True
         return self.grid[row][col] == 0
     
     def is_path(self, row, col):
         """Check if position is a path (1)"""
-        if not self.is_valid_position(row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
             return False
         return self.grid[row][col] == 1
     
     def set_cell(self, row, col, value):
         """Set a cell to path (1) or wall (0)"""
-        if self.is_valid_position(row, col):
+        if 0 <= row < self.rows and 0 <= col < self.cols and self.grid[row][col] != value:
             self.grid[row][col] = value
+            self.dirty_cells.add((row, col))
     
     def carve_path(self, row, col):
         """Carve a path at the given position"""
         self.set_cell(row, col, 1)
     
+    def pop_dirty_cells(self):
+        """Return the cells changed since the last call and reset tracking"""
+        dirty_cells = self.dirty_cells
+        self.dirty_cells = set()
+        return dirty_cells
+    
     def get_neighbors(self, row, col):
         """Get valid neighboring positions (up, right, down, left)"""
         directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
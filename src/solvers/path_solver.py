@@ -13,18 +13,21 @@ class PathSolver:
         self.current_step = 0
         self.solving_complete = False
         self.current_pos = None
+        self.step_count = 0  # Bumped whenever the traced path changes
         
     def set_solution_path(self, path):
         """Set the solution path to follow"""
         self.solution_path = path
         self.current_step = 0
         self.solving_complete = False
+        self.step_count += 1
         
     def start_solving(self):
         """Initialize solving phase"""
         self.current_step = 0
         self.solving_complete = False
         self.current_pos = self.maze_structure.get_start()
+        self.step_count += 1
         
     def step_solve(self):
         """Perform one step of path following. Returns True if continuing, False if complete."""
@@ -40,9 +43,19 @@ class PathSolver:
         # Move robot along the solution path
         self.current_pos = self.solution_path[self.current_step]
         self.current_step += 1
+        self.step_count += 1
         
         return True
     
+    def solve_all(self):
+        """Complete solving in one call (same end state as stepping until complete)"""
+        # The path is pre-computed, so finishing is just jumping to its end
+        if self.solution_path:
+            self.current_step = len(self.solution_path)
+            self.current_pos = self.solution_path[-1]
+        self.solving_complete = True
+        self.step_count += 1
+    
     def get_current_path(self):
         """Return the path traced so far"""
         if self.current_step > 0:
@@ -52,6 +65,7 @@ class PathSolver:
     def clear_path(self):
         """Clear the current path display"""
         self.current_step = 0
+        self.step_count += 1
     
     def is_complete(self):
         """Check if solving is complete"""
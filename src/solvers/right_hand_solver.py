@@ -2,6 +2,23 @@
 RightHandSolver - Implements right-hand wall following algorithm.
 Follows Single Responsibility Principle - only handles right-hand maze solving.
 """
+from maze.directions import RIGHT, DIRECTION_VECTORS, DIRECTION_NAMES
+
+# Right-hand rule: try turning right, then straight, then left, then turning around
+TURN_PRIORITY = (1, 0, 3, 2)
+
+
+def _right_hand_choice(direction, open_directions):
+    """Direction the right-hand rule takes given the open-direction bits, or -1 if boxed in"""
+    for turn in TURN_PRIORITY:
+        next_direction = (direction + turn) % 4
+        if open_directions >> next_direction & 1:
+            return next_direction
+    return -1
+
+
+# Every decision precomputed, indexed by direction << 4 | open-direction bits
+RIGHT_HAND_CHOICES = tuple(_right_hand_choice(index >> 4, index & 15) for index in range(64))
 
 
 class RightHandSolver:
@@ -13,122 +30,152 @@ class RightHandSolver:
         self.current_direction = 0  # 0=North, 1=East, 2=South, 3=West
         self.path_taken = []
         self.solving_complete = False
-        self.visited_positions = set()
+        self.step_count = 0  # Bumped whenever path_taken changes
+        self._passable = None  # Per-cell open-direction bits, built by start_solving
+        self._cells = None     # (row, col) of every cell, indexed by row * cols + col
+        self._offsets = None   # Cell index offset of one step in each direction
+        self._end_index = None
+        self._seen_states = None  # One byte per (cell, direction) the walk has been in
         
         # Direction vectors: North, East, South, West
-        self.directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        self.direction_names = ["up", "right", "down", "left"]
+        self.directions = DIRECTION_VECTORS
+        self.direction_names = DIRECTION_NAMES
         
     def start_solving(self):
         """Initialize right-hand solving from start position"""
         self.current_pos = self.maze_structure.get_start()
-        self.current_direction = 1  # Start facing East (towards the maze)
+        self.current_direction = RIGHT  # Start facing East (towards the maze)
         self.path_taken = [self.current_pos]
         self.solving_complete = False
-        self.visited_positions = {self.current_pos}
+        self._passable = self._build_passable()
+        
+        # Positions are walked as flat row * cols + col indices; the path stores
+        # the shared tuples from _cells so no position tuple is built per step
+        rows = self.maze_structure.rows
+        cols = self.maze_structure.cols
+        self._cells = [(row, col) for row in range(rows) for col in range(cols)]
+        self._offsets = tuple(dr * cols + dc for dr, dc in self.directions)
+        
+        # The exit is fixed while solving, so its lookups are done once here
+        # rather than at the start of every step_solve() call
+        end_row, end_col = self.maze_structure.get_end()
+        self._end_index = end_row * cols + end_col
+        
+        # Optimization: from a cell next to an open exit, always step straight onto it.
+        # Leaving only the exit's bit open there makes the normal move lookup take it.
+        if self.maze_structure.grid[end_row][end_col] == 1:
+            for direction, (dr, dc) in enumerate(self.directions):
+                row, col = end_row - dr, end_col - dc
+                if 0 <= row < rows and 0 <= col < cols:
+                    self._passable[row * cols + col] = 1 << direction
+        
+        # The walk is deterministic, so entering a cell facing the same way twice
+        # means it is circling and will never reach the exit
+        self._seen_states = bytearray(rows * cols * 4)
+        start_row, start_col = self.current_pos
+        self._seen_states[(start_row * cols + start_col) << 2 | self.current_direction] = 1
+        self.step_count += 1
         
     def step_solve(self):
         """Perform one step of right-hand wall following. Returns True if continuing, False if complete."""
+        return self._run_steps(1)
+    
+    def solve(self):
+        """Solve from the start in one call and return the full path taken"""
+        self.start_solving()
+        self.solve_all()
+        return self.get_current_path()
+    
+    def solve_all(self):
+        """Complete solving in one call (same end state as stepping until complete)"""
+        # Large batches of fused steps, like MazeGenerator.create_maze_instantly
+        batch = self.maze_structure.rows * self.maze_structure.cols
+        while self._run_steps(batch):
+            pass
+    
+    def _run_steps(self, max_steps):
+        """Run up to max_steps right-hand steps in one loop. Returns False once solving is complete."""
         if self.solving_complete:
             return False
-            
-        if self.current_pos == self.maze_structure.get_end():
-            self.solving_complete = True
-            return False
-            
-        # Optimization: Check if exit is directly adjacent and reachable
-        if self._is_exit_adjacent():
-            exit_pos = self.maze_structure.get_end()
-            self.current_pos = exit_pos
-            self.path_taken.append(exit_pos)
+        
+        pos = self.current_pos
+        if pos is None:
+            # Never started: nothing to solve
             self.solving_complete = True
             return False
-            
-        # Right-hand wall following algorithm
-        next_pos, next_direction = self._get_next_move()
-        
-        if next_pos:
-            self.current_pos = next_pos
-            self.current_direction = next_direction
-            self.path_taken.append(next_pos)
-            self.visited_positions.add(next_pos)
-        else:
-            # This shouldn't happen in a proper maze, but handle it
+        
+        # Solver tables as locals for the step loop
+        end_index = self._end_index
+        passable = self._passable
+        choices = RIGHT_HAND_CHOICES
+        offsets = self._offsets
+        cells = self._cells
+        seen_states = self._seen_states
+        path_taken = self.path_taken
+        index = pos[0] * self.maze_structure.cols + pos[1]
+        if index == end_index:
             self.solving_complete = True
             return False
-            
-        return True
-    
-    def _get_next_move(self):
-        """Calculate next position using right-hand rule"""
-        # Try to turn right first
-        right_direction = (self.current_direction + 1) % 4
-        right_pos = self._get_position_in_direction(self.current_pos, right_direction)
-        
-        if right_pos and self._can_move_to(right_pos):
-            return right_pos, right_direction
-        
-        # If can't turn right, try going straight
-        straight_pos = self._get_position_in_direction(self.current_pos, self.current_direction)
-        if straight_pos and self._can_move_to(straight_pos):
-            return straight_pos, self.current_direction
         
-        # If can't go straight, try turning left
-        left_direction = (self.current_direction - 1) % 4
-        left_pos = self._get_position_in_direction(self.current_pos, left_direction)
+        direction = self.current_direction
+        steps = 0
+        continuing = True
         
-        if left_pos and self._can_move_to(left_pos):
-            return left_pos, left_direction
-        
-        # If can't turn left, turn around
-        back_direction = (self.current_direction + 2) % 4
-        back_pos = self._get_position_in_direction(self.current_pos, back_direction)
-        
-        if back_pos and self._can_move_to(back_pos):
-            return back_pos, back_direction
+        for _ in range(max_steps):
+            # Right-hand rule, looked up from the cell's open-direction bits
+            next_direction = choices[direction << 4 | passable[index]]
+            if next_direction < 0:
+                # This shouldn't happen in a proper maze, but handle it
+                continuing = False
+                break
             
-        return None, self.current_direction
-    
-    def _get_position_in_direction(self, pos, direction):
-        """Get the position in the given direction from current position"""
-        if not pos:
-            return None
+            # The mask only allows in-maze moves, so the offset never wraps a row
+            next_index = index + offsets[next_direction]
+            state = next_index << 2 | next_direction
+            if seen_states[state]:
+                # Repeating an earlier state: the exit is unreachable from here
+                continuing = False
+                break
+            seen_states[state] = 1
+            
+            index = next_index
+            direction = next_direction
+            path_taken.append(cells[index])
+            steps += 1
             
-        row, col = pos
-        dr, dc = self.directions[direction]
-        new_row, new_col = row + dr, col + dc
+            if index == end_index:
+                # Reached the exit
+                continuing = False
+                break
         
-        if self.maze_structure.is_valid_position(new_row, new_col):
-            return (new_row, new_col)
-        return None
-    
-    def _can_move_to(self, pos):
-        """Check if we can move to the given position (not a wall)"""
-        if not pos:
-            return False
-        row, col = pos
-        return self.maze_structure.is_path(row, col)
+        self.current_pos = cells[index]
+        self.current_direction = direction
+        self.step_count += steps
+        if not continuing:
+            self.solving_complete = True
+        return continuing
     
-    def _is_exit_adjacent(self):
-        """Check if the exit is directly adjacent to current position and reachable"""
-        if not self.current_pos:
-            return False
-            
-        exit_pos = self.maze_structure.get_end()
-        if not exit_pos:
-            return False
-            
-        current_row, current_col = self.current_pos
-        exit_row, exit_col = exit_pos
+    def _build_passable(self):
+        """Build a row-major mask per cell whose bit d is set when the neighbour in direction d is a path"""
+        maze = self.maze_structure
+        grid = maze.grid
+        rows = maze.rows
+        cols = maze.cols
+        passable = bytearray(rows * cols)
         
-        # Check if exit is directly adjacent (Manhattan distance = 1)
-        if abs(current_row - exit_row) + abs(current_col - exit_col) == 1:
-            return self._can_move_to(exit_pos)
-            
-        return False
+        for direction, (dr, dc) in enumerate(self.directions):
+            bit = 1 << direction
+            # Only cells whose neighbour in this direction is inside the maze
+            for row in range(max(0, -dr), min(rows, rows - dr)):
+                neighbour_row = grid[row + dr]
+                base = row * cols
+                for col in range(max(0, -dc), min(cols, cols - dc)):
+                    if neighbour_row[col + dc] == 1:
+                        passable[base + col] |= bit
+        return passable
     
     def get_current_path(self):
-        """Return the path taken so far"""
+        """Return the path taken so far (the live list, not a copy: treat it as read-only)"""
         return self.path_taken
     
     def is_complete(self):
@@ -139,6 +186,10 @@ class RightHandSolver:
         """Get current position of the solver"""
         return self.current_pos
         
+    def get_current_direction(self):
+        """Get current direction as an int (see maze.directions) for robot orientation"""
+        return self.current_direction
+        
     def get_current_direction_name(self):
         """Get current direction as a string for robot orientation"""
         return self.direction_names[self.current_direction]